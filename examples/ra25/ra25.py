@@ -24,7 +24,7 @@
 from leabra import go, leabra, emer, relpos, eplot, env, agg, patgen, prjn, etable, efile, split, etensor, params, netview, rand, erand, gi, giv, pygiv, pyparams, mat32
 
 import importlib as il  #il.reload(ra25) -- doesn't seem to work for reasons unknown
-import io, sys, getopt
+import io, sys, getopt, time
 from datetime import datetime, timezone
 
 # import numpy as np
@@ -45,6 +45,10 @@ TheSim = 1
 # LogPrec is precision for saving float values in logs
 LogPrec = 4
 
+# Thread runs Hidden2 and Output on a separate Go thread in Cycle --
+# much slower for this small net, but helps for larger ones
+Thread = False
+
 # note: we cannot use methods for callbacks from Go -- must be separate functions
 # so below are all the callbacks from the GUI toolbar actions
 
@@ -129,9 +133,6 @@ def NewRndSeedCB(recv, send, sig, data):
 def ReadmeCB(recv, send, sig, data):
     gi.OpenURL("https://github.com/emer/leabra/blob/master/examples/ra25/README.md")
 
-def FilterSSE(et, row):
-    return etable.Table(handle=et).CellFloat("SSE", row) > 0 # include error trials    
-
 def UpdtFuncNotRunning(act):
     act.SetActiveStateUpdt(not TheSim.IsRunning)
     
@@ -260,6 +261,20 @@ class Sim(pygiv.ClassViewObj):
         self.SetTags("RunFile", 'view:"-" desc:"log file"')
         self.ValsTsrs = {}
         self.SetTags("ValsTsrs", 'view:"-" desc:"for holding layer values"')
+        self.InputLay = 0
+        self.SetTags("InputLay", 'view:"-" desc:"cached Input layer -- set in ConfigNet"')
+        self.OutputLay = 0
+        self.SetTags("OutputLay", 'view:"-" desc:"cached Output layer -- set in ConfigNet"')
+        self.ApplyLays = []
+        self.SetTags("ApplyLays", 'view:"-" desc:"(layer, name) pairs that get env inputs in ApplyInputs -- set in ConfigNet"')
+        self.LayStats = []
+        self.SetTags("LayStats", 'view:"-" desc:"(name, layer) pairs for LayStatNms, used in logging -- set in ConfigNet"')
+        self.TrnEpcLayCols = []
+        self.SetTags("TrnEpcLayCols", 'view:"-" desc:"(layer, col name) for per-layer cols in TrnEpcLog -- set in ConfigTrnEpcLog"')
+        self.TstTrlLayCols = []
+        self.SetTags("TstTrlLayCols", 'view:"-" desc:"(layer, col name) for per-layer cols in TstTrlLog -- set in ConfigTstTrlLog"')
+        self.TstCycCols = []
+        self.SetTags("TstCycCols", 'view:"-" desc:"(layer, Ge.Avg col, Act.Avg col) indexes into TstCycLog -- set in ConfigTstCycLog"')
         self.SaveWts = False
         self.SetTags("SaveWts", 'view:"-" desc:"for command-line run only, auto-save final weights after each run"')
         self.NoGui = False
@@ -275,7 +290,7 @@ class Sim(pygiv.ClassViewObj):
         self.RndSeed = int(1)
         self.SetTags("RndSeed", 'view:"-" desc:"the current random seed"')
         self.LastEpcTime = int()
-        self.SetTags("LastEpcTime", 'view:"-" desc:"timer for last epoch"')
+        self.SetTags("LastEpcTime", 'view:"-" desc:"timer for last epoch, in perf_counter_ns nsec"')
         self.vp  = 0 
         self.SetTags("vp", 'view:"-" desc:"viewport"')
 
@@ -349,10 +364,10 @@ class Sim(pygiv.ClassViewObj):
 
         # note: can set these to do parallel threaded computation across multiple cpus
         # not worth it for this small of a model, but definitely helps for larger ones
-        # if Thread {
-        #   hid2.SetThread(1)
-        #   out.SetThread(1)
-        # }
+        # threads run in Go, so Python-side Cycle calls still see one net
+        if Thread:
+            hid2.SetThread(1)
+            out.SetThread(1)
 
         # note: if you wanted to change a layer type from e.g., Target to Compare, do this:
         # out.SetType(emer.Compare)
@@ -364,6 +379,14 @@ class Sim(pygiv.ClassViewObj):
         net.Build()
         net.InitWts()
 
+        # cache layers used every trial, to avoid name lookups in ApplyInputs, TrialStats
+        ss.InputLay = leabra.Layer(net.LayerByName("Input"))
+        ss.OutputLay = leabra.Layer(net.LayerByName("Output"))
+        ss.ApplyLays = [(ss.InputLay, "Input"), (ss.OutputLay, "Output")]
+        ss.LayStats = []
+        for lnm in ss.LayStatNms:
+            ss.LayStats.append((lnm, leabra.Layer(net.LayerByName(lnm))))
+
     def Init(ss):
         """
         Init restarts the run, and initializes everything, including network weights
@@ -423,33 +446,59 @@ class Sim(pygiv.ClassViewObj):
         if train:
             ss.Net.WtFmDWt()
 
-        ss.Net.AlphaCycInit()
-        ss.Time.AlphaCycStart()
+        # hoist Go attribute lookups out of the cycle loop -- each is a cgo call
+        net = ss.Net
+        tm = ss.Time
+        cycle = net.Cycle
+        cycleInc = tm.CycleInc
+        cycPerQtr = tm.CycPerQtr
+
+        # view update decisions are fixed for the whole alpha cycle -- decide once here
+        viewOn = ss.ViewOn
+        cycView = viewOn and viewUpdt == leabra.Cycle
+        spikeView = viewOn and viewUpdt == leabra.FastSpike
+        qtrView = viewOn and viewUpdt <= leabra.Quarter
+        phaseView = viewOn and viewUpdt == leabra.Phase
+        # cycle log is only viewed in the TstCycPlot -- skip it when running without gui
+        logCyc = not train and not ss.NoGui
+        perCyc = cycView or spikeView or logCyc
+
+        if logCyc:
+            ncyc = 4 * cycPerQtr
+            dt = ss.TstCycLog
+            if dt.Rows < ncyc:
+                dt.SetNumRows(ncyc) # size once per trial, not per cycle in LogTstCyc
+
+        net.AlphaCycInit()
+        tm.AlphaCycStart()
         for qtr in range(4):
-            for cyc in range(ss.Time.CycPerQtr):
-                ss.Net.Cycle(ss.Time)
-                if not train:
-                    ss.LogTstCyc(ss.TstCycLog, ss.Time.Cycle)
-                ss.Time.CycleInc()
-                if ss.ViewOn:
-                    if viewUpdt == leabra.Cycle:
-                        if cyc != ss.Time.CycPerQtr-1: # will be updated by quarter
+            if not perCyc:
+                for cyc in range(cycPerQtr):
+                    cycle(tm)
+                    cycleInc()
+            else:
+                for cyc in range(cycPerQtr):
+                    cycle(tm)
+                    if logCyc:
+                        ss.LogTstCyc(ss.TstCycLog, tm.Cycle)
+                    cycleInc()
+                    if cycView:
+                        if cyc != cycPerQtr-1: # will be updated by quarter
                             ss.UpdateView(train)
-                    if viewUpdt == leabra.FastSpike:
+                    if spikeView:
                         if (cyc+1)%10 == 0:
                             ss.UpdateView(train)
-            ss.Net.QuarterFinal(ss.Time)
-            ss.Time.QuarterInc()
-            if ss.ViewOn:
-                if viewUpdt <= leabra.Quarter:
+            net.QuarterFinal(tm)
+            tm.QuarterInc()
+            if qtrView:
+                ss.UpdateView(train)
+            if phaseView:
+                if qtr >= 2:
                     ss.UpdateView(train)
-                if viewUpdt == leabra.Phase:
-                    if qtr >= 2:
-                        ss.UpdateView(train)
 
         if train:
-            ss.Net.DWt()
-        if ss.ViewOn and viewUpdt == leabra.AlphaCycle:
+            net.DWt()
+        if viewOn and viewUpdt == leabra.AlphaCycle:
             ss.UpdateView(train)
         if ss.TstCycPlot != 0 and not train:
             ss.TstCycPlot.GoUpdate() # make sure up-to-date at end
@@ -463,10 +512,8 @@ class Sim(pygiv.ClassViewObj):
         (training, testing, etc).
         """
 
-        lays = ["Input", "Output"]
-        for lnm in lays :
-            ly = leabra.Layer(ss.Net.LayerByName(lnm))
-            pats = en.State(ly.Nm)
+        for ly, lnm in ss.ApplyLays:
+            pats = en.State(lnm)
             if pats != 0:
                 ly.ApplyExt(pats)
 
@@ -558,7 +605,7 @@ class Sim(pygiv.ClassViewObj):
         different time-scales over which stats could be accumulated etc.
         You can also aggregate directly from log data, as is done for testing stats
         """
-        out = leabra.Layer(ss.Net.LayerByName("Output"))
+        out = ss.OutputLay
         ss.TrlCosDiff = float(out.CosDiff.Cos)
         ss.TrlSSE = out.SSE(0.5) # 0.5 = per-unit tolerance -- right side of .5
         ss.TrlAvgSSE = ss.TrlSSE / len(out.Neurons)
@@ -748,10 +795,10 @@ class Sim(pygiv.ClassViewObj):
         """
         ValsTsr gets value tensor of given name, creating if not yet made
         """
-        if name in ss.ValsTsrs:
-            return ss.ValsTsrs[name]
-        tsr = etensor.Float32()
-        ss.ValsTsrs[name] = tsr
+        tsr = ss.ValsTsrs.get(name)
+        if tsr is None:
+            tsr = etensor.Float32()
+            ss.ValsTsrs[name] = tsr
         return tsr
 
     def RunName(ss):
@@ -775,7 +822,7 @@ class Sim(pygiv.ClassViewObj):
         """
         WeightsFileName returns default current weights file name
         """
-        return ss.Net.Nm + "_" + ss.RunName() + "_" + ss.RunEpochName(ss.TrainEnv.Run.Cur, ss.TrainEnv.Epoch.Cur) + ".wts"
+        return "%s_%s_%s.wts" % (ss.Net.Nm, ss.RunName(), ss.RunEpochName(ss.TrainEnv.Run.Cur, ss.TrainEnv.Epoch.Cur))
 
     def LogFileName(ss, lognm):
         """
@@ -810,12 +857,13 @@ class Sim(pygiv.ClassViewObj):
         else:
             ss.NZero = 0
 
-        # if ss.LastEpcTime.IsZero():
-        #     ss.EpcPerTrlMSec = 0
-        # else:
-        #     iv = time.Now().Sub(ss.LastEpcTime)
-        #     ss.EpcPerTrlMSec = float(iv) / (nt * float(time.Millisecond))
-        # ss.LastEpcTime = time.Now()
+        now = time.perf_counter_ns() # monotonic, integer nsec
+        if ss.LastEpcTime == 0:
+            ss.EpcPerTrlMSec = 0.0
+        else:
+            iv = now - ss.LastEpcTime
+            ss.EpcPerTrlMSec = float(iv) / (nt * 1e6)
+        ss.LastEpcTime = now
 
         dt.SetCellFloat("Run", row, float(ss.TrainEnv.Run.Cur))
         dt.SetCellFloat("Epoch", row, float(epc))
@@ -824,11 +872,10 @@ class Sim(pygiv.ClassViewObj):
         dt.SetCellFloat("PctErr", row, ss.EpcPctErr)
         dt.SetCellFloat("PctCor", row, ss.EpcPctCor)
         dt.SetCellFloat("CosDiff", row, ss.EpcCosDiff)
-        # dt.SetCellFloat("PerTrlMSec", row, ss.EpcPerTrlMSec)
+        dt.SetCellFloat("PerTrlMSec", row, ss.EpcPerTrlMSec)
 
-        for lnm in ss.LayStatNms:
-            ly = leabra.Layer(ss.Net.LayerByName(lnm))
-            dt.SetCellFloat(ly.Nm+"_ActAvg", row, float(ly.Pool(0).ActAvg.ActPAvgEff))
+        for ly, col in ss.TrnEpcLayCols:
+            dt.SetCellFloat(col, row, float(ly.Pool(0).ActAvg.ActPAvgEff))
 
         if ss.TrnEpcPlot != 0:
             ss.TrnEpcPlot.GoUpdate()
@@ -843,8 +890,8 @@ class Sim(pygiv.ClassViewObj):
         dt.SetMetaData("read-only", "true")
         dt.SetMetaData("precision", str(LogPrec))
 
-        sch = etable.Schema(
-            [etable.Column("Run", etensor.INT64, go.nil, go.nil),
+        # build all columns in python first, so the Go schema is made in one call
+        cols = [etable.Column("Run", etensor.INT64, go.nil, go.nil),
             etable.Column("Epoch", etensor.INT64, go.nil, go.nil),
             etable.Column("SSE", etensor.FLOAT64, go.nil, go.nil),
             etable.Column("AvgSSE", etensor.FLOAT64, go.nil, go.nil),
@@ -852,10 +899,12 @@ class Sim(pygiv.ClassViewObj):
             etable.Column("PctCor", etensor.FLOAT64, go.nil, go.nil),
             etable.Column("CosDiff", etensor.FLOAT64, go.nil, go.nil),
             etable.Column("PerTrlMSec", etensor.FLOAT64, go.nil, go.nil)]
-        )
-        for lnm in ss.LayStatNms:
-            sch.append(etable.Column(lnm + "_ActAvg", etensor.FLOAT64, go.nil, go.nil))
-        dt.SetFromSchema(sch, 0)
+        ss.TrnEpcLayCols = []
+        for lnm, ly in ss.LayStats:
+            col = lnm + "_ActAvg"
+            ss.TrnEpcLayCols.append((ly, col))
+            cols.append(etable.Column(col, etensor.FLOAT64, go.nil, go.nil))
+        dt.SetFromSchema(etable.Schema(cols), 0)
 
     def ConfigTrnEpcPlot(ss, plt, dt):
         plt.Params.Title = "Leabra Random Associator 25 Epoch Plot"
@@ -881,8 +930,8 @@ class Sim(pygiv.ClassViewObj):
         log always contains number of testing items
         """
         epc = ss.TrainEnv.Epoch.Prv
-        inp = leabra.Layer(ss.Net.LayerByName("Input"))
-        out = leabra.Layer(ss.Net.LayerByName("Output"))
+        inp = ss.InputLay
+        out = ss.OutputLay
 
         trl = ss.TestEnv.Trial.Cur
         row = trl
@@ -899,9 +948,8 @@ class Sim(pygiv.ClassViewObj):
         dt.SetCellFloat("AvgSSE", row, ss.TrlAvgSSE)
         dt.SetCellFloat("CosDiff", row, ss.TrlCosDiff)
 
-        for lnm in ss.LayStatNms:
-            ly = leabra.Layer(ss.Net.LayerByName(lnm))
-            dt.SetCellFloat(ly.Nm+" ActM.Avg", row, float(ly.Pool(0).ActM.Avg))
+        for ly, col in ss.TstTrlLayCols:
+            dt.SetCellFloat(col, row, float(ly.Pool(0).ActM.Avg))
         ivt = ss.ValsTsr("Input")
         ovt = ss.ValsTsr("Output")
         inp.UnitValsTensor(ivt, "Act")
@@ -915,8 +963,8 @@ class Sim(pygiv.ClassViewObj):
             ss.TstTrlPlot.GoUpdate()
 
     def ConfigTstTrlLog(ss, dt):
-        inp = leabra.Layer(ss.Net.LayerByName("Input"))
-        out = leabra.Layer(ss.Net.LayerByName("Output"))
+        inp = ss.InputLay
+        out = ss.OutputLay
 
         dt.SetMetaData("name", "TstTrlLog")
         dt.SetMetaData("desc", "Record of testing per input pattern")
@@ -924,8 +972,8 @@ class Sim(pygiv.ClassViewObj):
         dt.SetMetaData("precision", str(LogPrec))
 
         nt = ss.TestEnv.Table.Len() # number in view
-        sch = etable.Schema(
-            [etable.Column("Run", etensor.INT64, go.nil, go.nil),
+        # build all columns in python first, so the Go schema is made in one call
+        cols = [etable.Column("Run", etensor.INT64, go.nil, go.nil),
             etable.Column("Epoch", etensor.INT64, go.nil, go.nil),
             etable.Column("Trial", etensor.INT64, go.nil, go.nil),
             etable.Column("TrialName", etensor.STRING, go.nil, go.nil),
@@ -933,14 +981,16 @@ class Sim(pygiv.ClassViewObj):
             etable.Column("SSE", etensor.FLOAT64, go.nil, go.nil),
             etable.Column("AvgSSE", etensor.FLOAT64, go.nil, go.nil),
             etable.Column("CosDiff", etensor.FLOAT64, go.nil, go.nil)]
-        )
-        for lnm in ss.LayStatNms :
-            sch.append(etable.Column(lnm + " ActM.Avg", etensor.FLOAT64, go.nil, go.nil))
-            
-        sch.append(etable.Column("InAct", etensor.FLOAT64, inp.Shp.Shp, go.nil))
-        sch.append(etable.Column("OutActM", etensor.FLOAT64, out.Shp.Shp, go.nil))
-        sch.append(etable.Column("OutActP", etensor.FLOAT64, out.Shp.Shp, go.nil))
-        dt.SetFromSchema(sch, nt)
+        ss.TstTrlLayCols = []
+        for lnm, ly in ss.LayStats:
+            col = lnm + " ActM.Avg"
+            ss.TstTrlLayCols.append((ly, col))
+            cols.append(etable.Column(col, etensor.FLOAT64, go.nil, go.nil))
+
+        cols.append(etable.Column("InAct", etensor.FLOAT64, inp.Shp.Shp, go.nil))
+        cols.append(etable.Column("OutActM", etensor.FLOAT64, out.Shp.Shp, go.nil))
+        cols.append(etable.Column("OutActP", etensor.FLOAT64, out.Shp.Shp, go.nil))
+        dt.SetFromSchema(etable.Schema(cols), nt)
 
     def ConfigTstTrlPlot(ss, plt, dt):
         plt.Params.Title = "Leabra Random Associator 25 Test Trial Plot"
@@ -978,16 +1028,23 @@ class Sim(pygiv.ClassViewObj):
         dt.SetCellFloat("Epoch", row, float(epc))
         dt.SetCellFloat("SSE", row, agg.Sum(tix, "SSE")[0])
         dt.SetCellFloat("AvgSSE", row, agg.Mean(tix, "AvgSSE")[0])
-        dt.SetCellFloat("PctErr", row, agg.Mean(tix, "Err")[0])
-        dt.SetCellFloat("PctCor", row, 1-agg.Mean(tix, "Err")[0])
+        pcterr = agg.Mean(tix, "Err")[0]
+        dt.SetCellFloat("PctErr", row, pcterr)
+        dt.SetCellFloat("PctCor", row, 1-pcterr)
         dt.SetCellFloat("CosDiff", row, agg.Mean(tix, "CosDiff")[0])
 
-        trlix = etable.NewIdxView(trl)
-        trlix.Filter(FilterSSE) # requires separate function
+        # select error trials with one pass over the SSE column, instead of a
+        # Filter callback from Go into Python for every row
+        sse = trl.ColByName("SSE")
+        errs = []
+        for ri in range(trl.Rows):
+            if sse.FloatVal1D(ri) > 0: # include error trials
+                errs.append(ri)
+        tix.Idxs = go.Slice_int(errs) # done with full view -- reuse it for the error trials
 
-        ss.TstErrLog = trlix.NewTable()
+        ss.TstErrLog = tix.NewTable()
 
-        allsp = split.All(trlix)
+        allsp = split.All(tix)
         split.Agg(allsp, "SSE", agg.AggSum)
         split.Agg(allsp, "AvgSSE", agg.AggMean)
         split.Agg(allsp, "InAct", agg.AggMean)
@@ -1034,20 +1091,21 @@ class Sim(pygiv.ClassViewObj):
     def LogTstCyc(ss, dt, cyc):
         """
         LogTstCyc adds data from current trial to the TstCycLog table.
-        log just has 100 cycles, is overwritten
+        log just has 100 cycles, is overwritten.
+        AlphaCyc sizes the table for the full alpha cycle before calling this.
         """
-        if dt.Rows <= cyc:
-            dt.SetNumRows(cyc + 1)
-
-        dt.SetCellFloat("Cycle", cyc, float(cyc))
-        for lnm in ss.LayStatNms:
-            ly = leabra.Layer(ss.Net.LayerByName(lnm))
-            dt.SetCellFloat(ly.Nm+" Ge.Avg", cyc,  float(ly.Pool(0).Inhib.Ge.Avg))
-            dt.SetCellFloat(ly.Nm+" Act.Avg", cyc, float(ly.Pool(0).Inhib.Act.Avg))
+        dt.SetCellFloatIdx(0, cyc, float(cyc)) # Cycle is first col
+        for ly, gei, acti in ss.TstCycCols:
+            inhib = ly.Pool(0).Inhib
+            dt.SetCellFloatIdx(gei, cyc, float(inhib.Ge.Avg))
+            dt.SetCellFloatIdx(acti, cyc, float(inhib.Act.Avg))
 
         if ss.TstCycPlot != 0 and cyc%10 == 0: # too slow to do every cyc
-            # note: essential to use Go version of update when called from another goroutine
-            ss.TstCycPlot.GoUpdate()
+            # intermediate updates only matter if the plot is showing -- AlphaCyc
+            # always does a final update at the end of the trial
+            if ss.TstCycPlot.IsVisible():
+                # note: essential to use Go version of update when called from another goroutine
+                ss.TstCycPlot.GoUpdate()
 
     def ConfigTstCycLog(ss, dt):
         dt.SetMetaData("name", "TstCycLog")
@@ -1056,13 +1114,21 @@ class Sim(pygiv.ClassViewObj):
         dt.SetMetaData("precision", str(LogPrec))
 
         np = 100 # max cycles
-        sch = etable.Schema(
-            [etable.Column("Cycle", etensor.INT64, go.nil, go.nil)]
-        )
-        for lnm in ss.LayStatNms:
-            sch.append(etable.Column(lnm + " Ge.Avg", etensor.FLOAT64, go.nil, go.nil))
-            sch.append(etable.Column(lnm + " Act.Avg", etensor.FLOAT64, go.nil, go.nil))
-        dt.SetFromSchema(sch, np)
+        # build all columns in python first, so the Go schema is made in one call
+        cols = [etable.Column("Cycle", etensor.INT64, go.nil, go.nil)]
+        laycols = []
+        for lnm, ly in ss.LayStats:
+            gecol = lnm + " Ge.Avg"
+            actcol = lnm + " Act.Avg"
+            laycols.append((ly, gecol, actcol))
+            cols.append(etable.Column(gecol, etensor.FLOAT64, go.nil, go.nil))
+            cols.append(etable.Column(actcol, etensor.FLOAT64, go.nil, go.nil))
+        dt.SetFromSchema(etable.Schema(cols), np)
+
+        # LogTstCyc is called every cycle, so look up its columns once here
+        ss.TstCycCols = []
+        for ly, gecol, actcol in laycols:
+            ss.TstCycCols.append((ly, dt.ColIdx(gecol), dt.ColIdx(actcol)))
 
     def ConfigTstCycPlot(ss, plt, dt):
         plt.Params.Title = "Leabra Random Associator 25 Test Cycle Plot"
@@ -1081,7 +1147,8 @@ class Sim(pygiv.ClassViewObj):
         """
         epclog = ss.TrnEpcLog
         epcix = etable.NewIdxView(epclog)
-        if epcix.Len() == 0:
+        nepc = epcix.Len()
+        if nepc == 0:
             return
         
         run = ss.TrainEnv.Run.Cur # this is NOT triggered by increment yet -- use Cur
@@ -1090,9 +1157,9 @@ class Sim(pygiv.ClassViewObj):
 
         # compute mean over last N epochs for run level
         nlast = 5
-        if nlast > epcix.Len()-1:
-            nlast = epcix.Len() - 1
-        epcix.Idxs = epcix.Idxs[epcix.Len()-nlast:]
+        if nlast > nepc-1:
+            nlast = nepc - 1
+        epcix.Idxs = go.Slice_int(range(nepc-nlast, nepc)) # view rows are 0..nepc-1
 
         params = ss.RunName() # includes tag
 
@@ -13,7 +13,7 @@ def read_as_string(fnm):
     # reads file as string
     if not os.path.isfile(fnm):
         return ""
-    with open(fnm, "r") as f:
+    with open(fnm, "r", encoding="utf-8") as f:
         val = f.read()
     return val
 
@@ -9,7 +9,7 @@
 #
 # Generates mysim.py conversion of mysim.go, attempting to 
 
-import os, sys, subprocess
+import os, re, sys, subprocess, hashlib, shutil, tempfile
 
 debug = False
 
@@ -22,99 +22,165 @@ def read_as_string(fnm):
     # reads file as string
     if not os.path.isfile(fnm):
         return ""
-    with open(fnm, "r") as f:
+    with open(fnm, "r", encoding="utf-8") as f:
         val = f.read()
     return val
 
 def write_string(fnm, stval):
-    with open(fnm,"w") as f:
+    with open(fnm, "w", encoding="utf-8") as f:
         f.write(stval)
 
+def gotopy_cache_path(fname):
+    # returns path of cached gotopy output for fname, keyed on the file contents
+    # and the gotopy binary (path + mtime, so a rebuilt gotopy misses) -- "" if
+    # gotopy is not on the path
+    exe = shutil.which("gotopy")
+    if exe is None:
+        return ""
+    h = hashlib.sha256()
+    with open(fname, "rb") as f:
+        h.update(f.read())
+    h.update(("\0%s\0%d\0-gogi" % (exe, os.stat(exe).st_mtime_ns)).encode("utf-8"))
+    cdir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cdir, "leabra-to", h.hexdigest() + ".py")
+
 def gotopy(fname):
+    cfn = gotopy_cache_path(fname)
+    if cfn != "" and os.path.isfile(cfn):
+        with open(cfn, "rb") as f:
+            return str(f.read(), "utf-8") # exact bytes of the gotopy output, as below
     result = subprocess.run(["gotopy","-gogi", fname], capture_output=True)
     if len(result.stderr) > 0:
         print(str(result.stderr, "utf-8"))
-    return str(result.stdout, "utf-8")
+    out = str(result.stdout, "utf-8")
+    if cfn != "" and result.returncode == 0 and len(result.stderr) == 0:
+        # write to a temp file and rename, so an interrupted run never leaves a partial entry
+        cdir = os.path.dirname(cfn)
+        os.makedirs(cdir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cdir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(result.stdout)
+            os.replace(tmp, cfn)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    return out
     
+# simple text replacements done on the whole file by repls, in passes: a later
+# pass can match text made by an earlier one, e.g., leabra.LeabraLayer(`x`)
+# needs the layer rename before the backtick replacement can see the (`
+replpasses = [
+    {
+        "leabra.LeabraLayer(": "leabra.Layer(",
+        ".AsLeabra()": "",
+    },
+    {
+        "(`": "('",
+        "`)": "')",
+    },
+    {
+        " = ss.TrainUpdt": " = ss.TrainUpdt.value",
+        " = ss.TestUpdt": " = ss.TestUpdt.value",
+        " ss.TrainUpdt >": " ss.TrainUpdt.value >",
+        " ss.TestUpdt >": " ss.TestUpdt.value >",
+    },
+]
+
+# regex for each pass, longest keys first, so a key is never cut short by another that is its prefix
+replres = [(re.compile("|".join(re.escape(k) for k in sorted(rm, key=len, reverse=True))), rm) for rm in replpasses]
+
 def repls(txt):
-    txt = txt.replace("leabra.LeabraLayer(", "leabra.Layer(")
-    txt = txt.replace(".AsLeabra()", "")
-    txt = txt.replace("(`", "('")
-    txt = txt.replace("`)", "')")
-    txt = txt.replace(" = ss.TrainUpdt", " = ss.TrainUpdt.value")
-    txt = txt.replace(" = ss.TestUpdt", " = ss.TestUpdt.value")
-    txt = txt.replace(" ss.TrainUpdt >", " ss.TrainUpdt.value >")
-    txt = txt.replace(" ss.TestUpdt >", " ss.TestUpdt.value >")
+    # one scan of the text per pass
+    for rre, rm in replres:
+        txt = rre.sub(lambda m: rm[m.group(0)], txt)
     return txt
     
-def inserttxt(txt, ati, ins):
-    if debug:
-        print("\n##########\nins:")
-        print(ins)
-    for i, v in enumerate(ins):
-        txt.insert(ati+i, v)
-
-def repltxt(txt, ati, ftxt, itxt):
-    if debug:
-        print("\n##########\nrepl:")
-        print(ftxt)
+def debugedit(kind, ftxt, itxt):
+    if not debug:
+        return
+    print("\n##########\n%s:" % kind)
+    print(ftxt)
+    if itxt is not None:
         print("with:")
         print(itxt)
-    nf = len(ftxt)
-    ni = len(itxt)
-    for i, v in enumerate(itxt):
-        if i < nf:
-            txt[ati+i] = v
-        else:
-            txt.insert(ati+i, v)
-    if nf > ni:
-        del txt[ati+ni:ati+nf]
 
 def diffs(txt):
     lns = txt.splitlines()
-    nln = lns.copy()
-    ni = 0
+    # edits are (start, end, newlines) on original line indexes -- lines
+    # start..end-1 are replaced by newlines, and start == end is an insert.
+    # output is built in one pass at the end instead of shifting a list.
+    edits = []
     insi = -1
     rpli = -1
     deli = -1
-    didone = False
+    # one scan of each line for all insert keys -- most lines match none,
+    # and only those that do need the in-order search below
+    insre = re.compile("|".join(re.escape(ir[0]) for ir in inserts))
+    # replaces and deletes match on equality with their first line, so index
+    # them by that line -- each source line is one dict lookup
+    rplfirst = {}
+    for j, rp in enumerate(replaces):
+        rplfirst.setdefault(rp[0][0], []).append(j)
+    delfirst = {}
+    for j, ft in enumerate(deletes):
+        delfirst.setdefault(ft[0], []).append(j)
+    lastins = len(inserts) - 1
+    lastrpl = len(replaces) - 1
+    lastdel = len(deletes) - 1
     for i, v in enumerate(lns):
-        for j, ir in enumerate(inserts):
-            if j <= insi:
-                continue
-            ftxt = ir[0]
-            lnoff = ir[1]
-            itxt = ir[2]
-            if ftxt in v:
-                inserttxt(nln, ni+lnoff, itxt)
-                ni += len(itxt)
-                insi = j
-                break
-        for j, rp in enumerate(replaces):
+        if insi == lastins and rpli == lastrpl and deli == lastdel:
+            break # every edit has been found -- rest of file is unchanged
+        if insre.search(v) is not None:
+            for j, ir in enumerate(inserts):
+                if j <= insi:
+                    continue
+                ftxt = ir[0]
+                lnoff = ir[1]
+                itxt = ir[2]
+                if ftxt in v:
+                    debugedit("ins", ftxt, itxt)
+                    edits.append((i+lnoff, i+lnoff, itxt))
+                    insi = j
+                    break
+        for j in rplfirst.get(v, ()):
             if j <= rpli:
                 continue
-            ftxt = rp[0]
-            itxt = rp[1]
-            if ftxt[0] == v:
-                repltxt(nln, ni, ftxt, itxt)
-                ni += len(itxt) - len(ftxt)
-                rpli = j
-                break
-        for j, ft in enumerate(deletes):
+            ftxt = replaces[j][0]
+            itxt = replaces[j][1]
+            debugedit("repl", ftxt, itxt)
+            edits.append((i, i+len(ftxt), itxt))
+            rpli = j
+            break
+        for j in delfirst.get(v, ()):
             if j <= deli:
                 continue
-            if ft[0] == v:
-                if debug:
-                    print("\n##########\ndel:")
-                    print(ft)
-                del nln[ni:ni+len(ft)]
-                ni -= len(ft)
-                deli = j
-                break
-        ni += 1
+            ft = deletes[j]
+            debugedit("del", ft, None)
+            edits.append((i, i+len(ft), []))
+            deli = j
+            break
+    # stable sort keeps an insert ahead of a replace at the same line, as found
+    edits.sort(key=lambda e: e[0])
+    nln = []
+    cur = 0
+    for st, ed, itxt in edits:
+        if st > cur:
+            nln.extend(lns[cur:st])
+            cur = st
+        nln.extend(itxt) # overlapping edits go at the current position
+        if ed > cur:
+            cur = ed
+    nln.extend(lns[cur:])
     return '\n'.join(nln)
     
+# colre matches a schema column line: group 1 is all text before the first (",
+# and the lookahead requires etensor. somewhere on the line
+colre = re.compile(r'(?=.*etensor\.)(.*?)(\(".*)')
+
 def column(txt):
+    if " = etable.Schema(" not in txt:
+        return txt
     lns = txt.splitlines()
     insc = False
     start = False
@@ -123,20 +189,20 @@ def column(txt):
             insc = True
             start = True
             continue
-        if insc and "etensor." in v:
-            op = v.find('("')
-            if op < 0:
-                insc = False
-                continue
+        if not insc:
+            continue
+        m = colre.match(v)
+        if m is not None:
             if start:
-                lns[i] = v[:op] + "[etable.Column" + v[op:]
+                lns[i] = m.group(1) + "[etable.Column" + m.group(2)
                 start = False
             else:
-                lns[i] = v[:op] + "etable.Column" + v[op:]
-        elif insc:
+                lns[i] = m.group(1) + "etable.Column" + m.group(2)
+        elif "etensor." in v: # no (" to insert at
+            insc = False
+        else:
             lns[i-1] = lns[i-1][:-1] + "]"
             insc = False
-            continue
     return '\n'.join(lns)
 
 def main(argv):
@@ -9,63 +9,160 @@
 
 from etorch import go, etorch, gi, netview
 
-import torch
-
 class State(object):
     """
     State manages saving and copying of network state
     """
     def __init__(self, nn):
         self.nn = nn  # our torch.nn module
-        self.record = True # set to False to turn off recording
+        self.record = True # set to False to turn off recording -- see record property
         self.rec_wts = False # set to True to turn on recording of prjn-level weight state
+        self.skip_wts = False # set to True to only copy weights that have changed since last recorded -- see wts_changed
         self.trace = False # print out dimensions of what is recorded -- useful for initial config
         self.wtmap = {}  # dict of names for prjn weights
+        self.wtvers = {}  # (data_ptr, _version) of last recorded weight, bias tensors, by recording destination
         self.net = 0 # network that we save to
+        self.varmap = {} # (layer name, layer, state) for each recorded var -- reset in set_net
+        self.prjnmap = {} # list of (prjn name, prjn) receiving prjns for each layer name -- reset in set_net
+        self.wtcache = {} # (weight, bias or None) tensors for each prjn in wtmap -- reset in refresh_state_dict
     
     def set_net(self, net):
         """
         set_net sets the etorch.Network to display to
         """
         self.net = net
+        self.varmap = {}
+        self.prjnmap = {}
+        self.wtvers = {}
+
+    @property
+    def record(self):
+        """
+        record is True if recording is on -- setting it to False replaces rec
+        on this instance by a function that does nothing, so rec calls in
+        forward passes return without checking any state, and setting it to
+        True restores the rec method
+        """
+        return self.__dict__.get("rec") is not no_rec
+
+    @record.setter
+    def record(self, on):
+        if on:
+            self.__dict__.pop("rec", None)
+        else:
+            self.rec = no_rec
+
+    def set_recording(self, on):
+        """
+        set_recording turns recording on or off -- same as setting record
+        """
+        self.record = on
     
     def rec(self, x, var):
         """
         rec records current tensor state x to variable named var
         """
-        if not self.record:
-            return
         if self.trace:
             print(var, x.size())
 
-        sd = self.nn.state_dict()
-        net = self.net
+        vr = self.varmap.get(var)
+        if vr is None:
+            vr = self.var_state(var)
+        lnm, ly, nst = vr
+        nst.Values.copy(flat_vals(x))
         
+        if not self.rec_wts:
+            return
+            
+        pjs = self.prjnmap.get(lnm)
+        if pjs is None:
+            pjs = [(pj.Name(), pj) for pj in (etorch.Prjn(handle=pi) for pi in ly.RcvPrjns)]
+            self.prjnmap[lnm] = pjs
+        skip = self.skip_wts
+        lbst = None
+        for pnm, pj in pjs:
+            wc = self.wtcache.get(pnm)
+            if wc is None:
+                if not pnm in self.wtmap:
+                    continue
+                wc = self.prjn_wts(pnm)
+            wts, bst = wc
+            if not skip or self.wts_changed(pnm, wts):
+                pst = pj.States["Wt"]
+                pst.Values.copy(flat_vals(wts))
+            if bst is not None:
+                lbst = bst # layer Bias is from the last prjn with a bias
+        if lbst is not None and (not skip or self.wts_changed(lnm + ":Bias", lbst)):
+            lst = ly.States["Bias"]
+            lst.Values.copy(flat_vals(lbst))
+
+    def prjn_wts(self, pnm):
+        """
+        prjn_wts looks up the weight and bias tensors for prjn named pnm in wtmap,
+        and caches them as (weight, bias or None).  The tensors come from
+        state_dict(keep_vars=True), so they are the live parameters and the cache
+        stays current as they are updated in place -- call refresh_state_dict
+        if the parameters of nn are replaced.
+        """
+        wnm = self.wtmap[pnm]
+        sd = self.nn.state_dict(keep_vars=True)
+        wc = (sd[wnm + ".weight"], sd.get(wnm + ".bias"))
+        self.wtcache[pnm] = wc
+        return wc
+
+    def refresh_state_dict(self):
+        """
+        refresh_state_dict clears the cached weight and bias tensors, so they are
+        looked up again from nn.state_dict -- call after replacing the nn module
+        or its parameters, or changing wtmap
+        """
+        self.wtcache = {}
+        self.wtvers = {}
+
+    def var_state(self, var):
+        """
+        var_state looks up the layer and state for var, named as layer.var,
+        and caches it, so repeated rec calls for the same var skip the name
+        parsing and Go-side lookups
+        """
         nmv = var.split(".")
         vnm = nmv[-1]
         lnm = ".".join(nmv[:-1])
-        ly = etorch.Layer(net.LayerByName(lnm))
+        ly = etorch.Layer(self.net.LayerByName(lnm))
         nst = ly.States[vnm]
-        nst.Values.copy(torch.flatten(x))
-        
-        if not self.rec_wts:
-            return
-            
-        for pi in ly.RcvPrjns:
-            pj = etorch.Prjn(handle=pi)
-            pnm = pj.Name()
-            if not pnm in self.wtmap:
-                continue
-            wnm = self.wtmap[pnm]
-            wts = sd[wnm + ".weight"]
-            pst = pj.States["Wt"]
-            pst.Values.copy(torch.flatten(wts))
-            bnm = wnm + ".bias"
-            if bnm in sd:
-                bst = sd[bnm]
-                lst = ly.States["Bias"]
-                lst.Values.copy(torch.flatten(bst))
+        vr = (lnm, ly, nst)
+        self.varmap[var] = vr
+        return vr
+
+    def wts_changed(self, nm, t):
+        """
+        wts_changed returns True if tensor t recorded to destination nm has been
+        modified since it was last recorded there, and marks it as recorded -- used
+        when skip_wts is on.  Uses the storage pointer (changes if the tensor is replaced)
+        and the autograd version counter, which is bumped by in-place updates of the
+        parameter itself, e.g., torch.optim steps.  Updates made through p.data
+        (p.data.add_(...), p.data -= lr * p.grad) do not bump it, as .data has its
+        own counter: leave skip_wts off if training updates weights that way.
+        """
+        ver = (t.data_ptr(), t._version)
+        if self.wtvers.get(nm) == ver:
+            return False
+        self.wtvers[nm] = ver
+        return True
                         
+def flat_vals(t):
+    """
+    flat_vals returns the values of tensor t as a flat python list, for copying
+    into Go slices: reshape only copies if t is not contiguous, and the list
+    is converted in one call, instead of indexing t for each element, which
+    makes a new tensor each time
+    """
+    return t.detach().reshape(-1).tolist()
+
+def no_rec(x, var):
+    """ no_rec is used in place of State.rec when recording is turned off """
+    pass
+
 class NetView(object):
     """
     NetView opens a separate window with the network view -- for standalone use.
@@ -114,8 +211,11 @@ class NetView(object):
 
     def update(ss):
         """
-        call update to update display
+        call update to update display -- always records the state, so the history
+        has no gaps, but only redraws if the window is open and visible
         """
         ss.NetView.Record("") # note: can include any kind of textual state information here to display too
+        if ss.Win == 0 or not ss.Win.IsVisible():
+            return
         ss.NetView.GoUpdate()
         
@@ -10,7 +10,6 @@
 from leabra import go, etable, etensor
 
 import numpy as np
-import pandas as pd
 import torch
 import torch.utils.data as data_utils
 
@@ -352,6 +351,7 @@ def etable_to_pandas(et, skip_tensors=False):
     of the given pyet.eTable, spreading tensor cells over sequential
     1d columns, if they aren't skipped over.
     """
+    import pandas as pd  # deferred: only needed for pandas conversion
     ed = {} 
     nc = len(et.Cols)
     for ci in range(nc):
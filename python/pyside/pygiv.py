@@ -4,6 +4,7 @@
 
 from leabra import go, gi, giv, kit, units
 from enum import Enum
+import operator, re
 
 class ClassViewObj(object):
     """
@@ -37,11 +38,15 @@ class ClassViewObj(object):
             self.ClassViewInline.Update()
         
     def OpenViewDialog(self, vp, name, tags):
-        """ opens a new dialog window for this object, or if one already exists, raises it """
+        """
+        opens a new dialog window for this object, or if one is already open, raises it
+        and updates its view, instead of building a new dialog and view
+        """
         if self.ClassViewDialog != 0 and self.ClassViewDialog.Win.IsVisible():
+            self.UpdateClassView()
             self.ClassViewDialog.Win.Raise()
             return
-        self.ClassViewDialog = ClassViewDialog(vp, self, name, tags, giv.DlgOpts(Title=name))
+        self.ClassViewDialog = ClassViewDialog(vp, self, name, tags, DlgOptsTitle(name))
         return self.ClassViewDialog
         
 class ClassViewInline(object):
@@ -53,15 +58,17 @@ class ClassViewInline(object):
     syntax as the struct field tags in Go: https://github.com/goki/gi/wiki/Tags
     for customizing the view properties (space separated, name:"value")
     """
+    __slots__ = ("Class", "Name", "Lay", "Tags", "Views", "Widgets", "Fields")
+
     def __init__(self, obj, name):
         """ note: essential to provide a distinctive name for each view """
         self.Class = obj
         self.Name = name
-        classviews[name] = self
         self.Lay = 0
         self.Tags = obj.Tags
         self.Views = {} # dict of ValueView reps of Go objs
         self.Widgets = {} # dict of Widget reps of Python objs
+        self.Fields = [] # (name, value type or None for Go, update func, widget or view) for fields with views, in order -- set in Config
         
     def FieldTags(self, field):
         """ returns the full string of tags for given field, empty string if none """
@@ -69,9 +76,13 @@ class ClassViewInline(object):
             return self.Tags[field]
         return ""
 
+    def FieldTagVals(self, field):
+        """ returns dict of parsed key: value tags for given field -- shared, must not be modified """
+        return ParseTags(self.FieldTags(field))
+
     def FieldTagVal(self, field, key):
         """ returns the value for given key in tags for given field, empty string if none """
-        return giv.StructTagVal(key, self.FieldTags(field))
+        return self.FieldTagVals(field).get(key, "")
 
     def Config(self):
         self.Lay = gi.Layout()
@@ -82,15 +93,19 @@ class ClassViewInline(object):
         flds = self.Class.__dict__
         self.Views = {}
         self.Widgets = {}
+        self.Fields = []
         for nm, val in flds.items():
+            if nm == "Tags" or nm.startswith("ClassView"):
+                continue
             tags = self.FieldTags(nm)
-            if HasTagValue(tags, "view", "-") or nm == "Tags" or nm.startswith("ClassView"):
+            tvals = self.FieldTagVals(nm)
+            if tvals.get("view", "") == "-":
                 continue
             lbl = gi.Label(self.Lay.AddNewChild(gi.KiT_Label(), "lbl_" + nm))
             lbl.Redrawable = True
             lbl.SetProp("horizontal-align", "left")
             lbl.SetText(nm)
-            dsc = self.FieldTagVal(nm, "desc")
+            dsc = tvals.get("desc", "")
             if dsc != "":
                 lbl.Tooltip = dsc
             if isinstance(val, go.GoClass):
@@ -104,23 +119,24 @@ class ClassViewInline(object):
                 vv.ConfigWidget(vw)
                 self.Views[nm] = vv
                 self.Widgets[nm] = vw
+                self.Fields.append((nm, None, GoObjUpdtView, vv))
                 # todo: vv.ViewSig.Connect?
             else:
                 vw = PyObjView(val, nm, self.Lay, self.Name, tags)
                 self.Widgets[nm] = vw
+                fieldviews[self.Name + ":" + nm] = (self, nm)
+                self.Fields.append((nm, type(val), PyObjSetFuncs[PyObjViewFunc(val)], vw))
         self.Lay.UpdateEnd(updt)
         
     def Update(self):
         updt = self.Lay.UpdateStart()
-        flds = self.Class.__dict__
-        for nm, val in flds.items():
-            if nm in self.Views:
-                vv = self.Views[nm]
-                giv.SetSoloValueIface(vv, val) # always update in case it might have changed
-                vv.UpdateWidget()
-            elif nm in self.Widgets:
-                vw = self.Widgets[nm]
-                PyObjUpdtView(val, vw, nm)
+        cls = self.Class
+        for nm, typ, updtfun, vw in self.Fields:
+            val = getattr(cls, nm)
+            if typ is None or type(val) is typ:
+                updtfun(val, vw, nm)
+            else:
+                PyObjUpdtView(val, vw, nm) # type changed since Config -- checks the widget
         self.Lay.UpdateEnd(updt)
 
 class ClassView(object):
@@ -131,15 +147,17 @@ class ClassView(object):
     syntax as the struct field tags in Go: https://github.com/goki/gi/wiki/Tags
     for customizing the view properties (space separated, name:"value")
     """
+    __slots__ = ("Class", "Name", "Frame", "Tags", "Views", "Widgets", "Fields")
+
     def __init__(self, obj, name):
         """ note: essential to provide a distinctive name for each view """
         self.Class = obj
         self.Name = name
-        classviews[name] = self
         self.Frame = 0
         self.Tags = obj.Tags
         self.Views = {} # dict of ValueView reps of Go objs
         self.Widgets = {} # dict of Widget reps of Python objs
+        self.Fields = [] # (name, value type or None for Go, update func, widget or view) for fields with views, in order -- set in Config
         
     def AddFrame(self, par):
         """ Add a new gi.Frame for the view to given parent gi object """
@@ -151,9 +169,13 @@ class ClassView(object):
             return self.Tags[field]
         return ""
 
+    def FieldTagVals(self, field):
+        """ returns dict of parsed key: value tags for given field -- shared, must not be modified """
+        return ParseTags(self.FieldTags(field))
+
     def FieldTagVal(self, field, key):
         """ returns the value for given key in tags for given field, empty string if none """
-        return giv.StructTagVal(key, self.FieldTags(field))
+        return self.FieldTagVals(field).get(key, "")
 
     def Config(self):
         self.Frame.SetStretchMaxWidth()
@@ -167,13 +189,17 @@ class ClassView(object):
         flds = self.Class.__dict__
         self.Views = {}
         self.Widgets = {}
+        self.Fields = []
         for nm, val in flds.items():
+            if nm == "Tags" or nm.startswith("ClassView"):
+                continue
             tags = self.FieldTags(nm)
-            if HasTagValue(tags, "view", "-") or nm == "Tags" or nm.startswith("ClassView"):
+            tvals = self.FieldTagVals(nm)
+            if tvals.get("view", "") == "-":
                 continue
             lbl = gi.Label(self.Frame.AddNewChild(gi.KiT_Label(), "lbl_" + nm))
             lbl.SetText(nm)
-            dsc = self.FieldTagVal(nm, "desc")
+            dsc = tvals.get("desc", "")
             if dsc != "":
                 lbl.Tooltip = dsc
             if isinstance(val, go.GoClass):
@@ -187,23 +213,24 @@ class ClassView(object):
                 vv.ConfigWidget(vw)
                 self.Views[nm] = vv
                 self.Widgets[nm] = vw
+                self.Fields.append((nm, None, GoObjUpdtView, vv))
                 # todo: vv.ViewSig.Connect?
             else:
                 vw = PyObjView(val, nm, self.Frame, self.Name, tags)
                 self.Widgets[nm] = vw
+                fieldviews[self.Name + ":" + nm] = (self, nm)
+                self.Fields.append((nm, type(val), PyObjSetFuncs[PyObjViewFunc(val)], vw))
         self.Frame.UpdateEnd(updt)
         
     def Update(self):
         updt = self.Frame.UpdateStart()
-        flds = self.Class.__dict__
-        for nm, val in flds.items():
-            if nm in self.Views:
-                vv = self.Views[nm]
-                giv.SetSoloValueIface(vv, val) # always update in case it might have changed
-                vv.UpdateWidget()
-            elif nm in self.Widgets:
-                vw = self.Widgets[nm]
-                PyObjUpdtView(val, vw, nm)
+        cls = self.Class
+        for nm, typ, updtfun, vw in self.Fields:
+            val = getattr(cls, nm)
+            if typ is None or type(val) is typ:
+                updtfun(val, vw, nm)
+            else:
+                PyObjUpdtView(val, vw, nm) # type changed since Config -- checks the widget
         self.Frame.UpdateEnd(updt)
 
 def ClassViewDialog(vp, obj, name, tags, opts):
@@ -229,16 +256,95 @@ def ClassViewDialog(vp, obj, name, tags, opts):
     dlg.Open(0, 0, vp, go.nil)
     return dlg
 
-# classviews is a dictionary of classviews -- needed for callbacks
-classviews = {}
+# fieldviews maps the full widget name (view name:field name) of each Python
+# field widget to its (view, field name), so callbacks get both in one lookup --
+# it keeps the views referenced while their widgets can call back, and a view
+# configured again under the same name replaces the entries of the old one
+fieldviews = {}
+
+# dlgopts is a dictionary of giv.DlgOpts by title, so re-opening a dialog
+# does not construct a new Go DlgOpts each time -- titles are field names
+dlgopts = {}
+
+def DlgOptsTitle(title):
+    """ returns a giv.DlgOpts with given Title, shared across calls with same title """
+    opts = dlgopts.get(title)
+    if opts is None:
+        opts = giv.DlgOpts(Title=title)
+        dlgopts[title] = opts
+    return opts
+
+# TagRe matches one key:"value" pair in a Go-style struct tag string
+TagRe = re.compile(r'([^\s:"]+):"((?:[^"\\]|\\.)*)"')
+
+# TagEscRe matches one backslash escape in a quoted tag value, as decoded by Go's
+# strconv.Unquote -- the last group is an invalid escape.  It works on the
+# utf-8 bytes of the value, as \x and octal escapes give single bytes in Go.
+TagEscRe = re.compile(rb'\\(?:([abfnrtv\\"])|x([0-9a-fA-F]{2})|([0-7]{3})|u([0-9a-fA-F]{4})|U([0-9a-fA-F]{8})|(.))', re.S)
+TagEscs = {b"a": b"\a", b"b": b"\b", b"f": b"\f", b"n": b"\n", b"r": b"\r",
+           b"t": b"\t", b"v": b"\v", b"\\": b"\\", b'"': b'"'}
+
+def TagUnesc(m):
+    """ returns the bytes for escape match m from TagEscRe, raising ValueError if invalid """
+    c, x, o, u, U, bad = m.groups()
+    if c is not None:
+        return TagEscs[c]
+    if x is not None:
+        return bytes([int(x, 16)])
+    if o is not None:
+        n = int(o, 8)
+        if n > 255:
+            raise ValueError("invalid escape")
+        return bytes([n])
+    if bad is None:
+        n = int(u or U, 16)
+        if n <= 0x10FFFF and not (0xD800 <= n <= 0xDFFF):
+            return chr(n).encode("utf-8")
+    raise ValueError("invalid escape")
+
+def TagUnquote(val):
+    """
+    returns the quoted tag value val (without the quotes) with its escapes decoded
+    as Go's strconv.Unquote does, or None if it has an invalid escape
+    """
+    try:
+        return TagEscRe.sub(TagUnesc, val.encode("utf-8")).decode("utf-8", "replace")
+    except ValueError:
+        return None
+
+# parsedtags is a dictionary of ParseTags results by tags string -- the
+# same tags are looked up for several keys by the view functions
+parsedtags = {}
+
+def ParseTags(tags):
+    """
+    returns a dict of key: value for all the key:"value" pairs in given tags string,
+    in one regex scan, without calling into Go -- gives same values as giv.StructTagVal
+    for well-formed tags, including escapes (malformed pairs are skipped rather than
+    ending the parse).  A key whose first value has an invalid escape is missing, as in Go.
+    Results are shared across calls with the same tags, so must not be modified.
+    """
+    tvals = parsedtags.get(tags)
+    if tvals is not None:
+        return tvals
+    tvals = {}
+    for key, val in TagRe.findall(tags):
+        if key in tvals: # first one wins, as in Go
+            continue
+        if "\\" in val:
+            val = TagUnquote(val)
+        tvals[key] = val
+    tvals = {key: val for key, val in tvals.items() if val is not None}
+    parsedtags[tags] = tvals
+    return tvals
 
 def TagValue(tags, key):
     """ returns tag value for given key """
-    return giv.StructTagVal(key, tags)
+    return ParseTags(tags).get(key, "")
 
 def HasTagValue(tags, key, value):
     """ returns true if given key has given value """
-    tval = giv.StructTagVal(key, tags)
+    tval = TagValue(tags, key)
     return tval == value
 
 def PyObjView(val, nm, frame, ctxt, tags):
@@ -248,119 +354,213 @@ def PyObjView(val, nm, frame, ctxt, tags):
     frame = gi.Frame or layout to add widgets to -- also callback recv
     ctxt = context for this object (e.g., name of owning struct)
     """
-    vw = 0
     fnm = ctxt + ":" + nm
+    vw = PyObjViewFunc(val)(val, nm, fnm, frame, ctxt, tags)
+    if HasTagValue(tags, "inactive", "+"):
+        vw.SetInactive()
+    return vw
+
+def PyObjViewFunc(val):
+    """ returns the function that makes the view widget for given value """
+    typ = type(val)
+    mkfun = PyObjViewFuncs.get(typ)
+    if mkfun is not None:
+        return mkfun
     if isinstance(val, Enum):
-        vw = gi.AddNewComboBox(frame, fnm)
-        vw.SetText(nm)
-        vw.SetPropStr("padding", "2px")
-        vw.SetPropStr("margin", "2px")
-        ItemsFromEnum(vw, val)
-        vw.ComboSig.Connect(frame, SetEnumCB)
+        mkfun = EnumView
     elif isinstance(val, ClassViewObj):
-        if HasTagValue(tags, "view", "inline"):
-            sv = val.NewClassViewInline(ctxt + "_" + nm)  # new full name
-            sv.Config()
-            frame.AddChild(sv.Lay)
-            vw = sv.Lay
-        else:
-            vw = gi.AddNewAction(frame, fnm)
-            vw.SetText(nm)
-            vw.SetPropStr("padding", "2px")
-            vw.SetPropStr("margin", "2px")
-            vw.SetPropStr("border-radius", "4px")
-            vw.ActionSig.Connect(frame, EditObjCB)
+        mkfun = ClassViewObjView
     elif isinstance(val, bool):
-        vw = gi.AddNewCheckBox(frame, fnm)
-        vw.SetChecked(val)
-        vw.ButtonSig.Connect(frame, SetBoolValCB)
+        mkfun = BoolView
     elif isinstance(val, (int, float)):
-        vw = gi.AddNewSpinBox(frame, fnm)
-        vw.SetValue(val)
-        if isinstance(val, int):
-            vw.SpinBoxSig.Connect(frame, SetIntValCB)
-            vw.Step = 1
-        else:
-            vw.SpinBoxSig.Connect(frame, SetFloatValCB)
-        mv = TagValue(tags, "min")
-        if mv != "":
-            vw.SetMin(float(mv))
-        mv = TagValue(tags, "max")
-        if mv != "":
-            vw.SetMax(float(mv))
-        mv = TagValue(tags, "step")
-        if mv != "":
-            vw.Step = float(mv)
-        mv = TagValue(tags, "format")
-        if mv != "":
-            vw.Format = mv
+        mkfun = NumView
     else:
-        vw = gi.AddNewTextField(frame, fnm)
-        vw.SetText(str(val))
-        vw.SetPropStr("min-width", "10em")
-        vw.TextFieldSig.Connect(frame, SetStrValCB)
-        mv = TagValue(tags, "width")
-        if mv != "":
-            vw.SetProp("width", mv + "ch")
-    if HasTagValue(tags, "inactive", "+"):
-        vw.SetInactive()
+        mkfun = StrView
+    PyObjViewFuncs[typ] = mkfun # so later values of this type skip the checks
+    return mkfun
+
+def EnumView(val, nm, fnm, frame, ctxt, tags):
+    vw = gi.AddNewComboBox(frame, fnm)
+    vw.SetText(nm)
+    vw.SetPropStr("padding", "2px")
+    vw.SetPropStr("margin", "2px")
+    ItemsFromEnum(vw, val)
+    vw.ComboSig.Connect(frame, SetEnumCB)
+    return vw
+
+def ClassViewObjView(val, nm, fnm, frame, ctxt, tags):
+    if HasTagValue(tags, "view", "inline"):
+        sv = val.NewClassViewInline(ctxt + "_" + nm)  # new full name
+        sv.Config()
+        frame.AddChild(sv.Lay)
+        return sv.Lay
+    vw = gi.AddNewAction(frame, fnm)
+    vw.SetText(nm)
+    vw.SetPropStr("padding", "2px")
+    vw.SetPropStr("margin", "2px")
+    vw.SetPropStr("border-radius", "4px")
+    vw.ActionSig.Connect(frame, EditObjCB)
+    return vw
+
+def BoolView(val, nm, fnm, frame, ctxt, tags):
+    vw = gi.AddNewCheckBox(frame, fnm)
+    vw.SetChecked(val)
+    vw.ButtonSig.Connect(frame, SetBoolValCB)
+    return vw
+
+def NumView(val, nm, fnm, frame, ctxt, tags):
+    vw = gi.AddNewSpinBox(frame, fnm)
+    vw.SetValue(val)
+    if isinstance(val, int):
+        vw.SpinBoxSig.Connect(frame, SetIntValCB)
+        vw.Step = 1
+    else:
+        vw.SpinBoxSig.Connect(frame, SetFloatValCB)
+    mv = TagValue(tags, "min")
+    if mv != "":
+        vw.SetMin(float(mv))
+    mv = TagValue(tags, "max")
+    if mv != "":
+        vw.SetMax(float(mv))
+    mv = TagValue(tags, "step")
+    if mv != "":
+        vw.Step = float(mv)
+    mv = TagValue(tags, "format")
+    if mv != "":
+        vw.Format = mv
     return vw
 
+def StrView(val, nm, fnm, frame, ctxt, tags):
+    vw = gi.AddNewTextField(frame, fnm)
+    vw.SetText(str(val))
+    vw.SetPropStr("min-width", "10em")
+    vw.TextFieldSig.Connect(frame, SetStrValCB)
+    mv = TagValue(tags, "width")
+    if mv != "":
+        vw.SetProp("width", mv + "ch")
+    return vw
+
+# PyObjViewFuncs maps exact value types to their view builder -- one dict lookup
+# for the common scalar fields, with the isinstance checks in PyObjViewFunc only
+# the first time each other type (Enum, ClassViewObj, subclasses) is seen
+PyObjViewFuncs = {bool: BoolView, int: NumView, float: NumView, str: StrView}
+
 def PyObjUpdtView(val, vw, nm):
     """
     updates the given view widget for given value
     """
+    PyObjUpdtFunc(val)(val, vw, nm)
+
+def PyObjUpdtFunc(val):
+    """
+    returns the function that updates a view widget for values of the same
+    kind as given value, checking that the widget is of the expected type --
+    Update uses it for fields whose type has changed since Config
+    """
+    typ = type(val)
+    updtfun = PyObjUpdtFuncs.get(typ)
+    if updtfun is not None:
+        return updtfun
     if isinstance(val, Enum):
-        if isinstance(vw, gi.ComboBox):
-            svw = gi.ComboBox(vw)
-            svw.SetCurVal(val.name)
-        else:
-            print("epygiv; Enum value: %s doesn't have ComboBox widget" % nm)
+        updtfun = EnumUpdtView
     elif isinstance(val, go.GoClass):
-        pass
+        updtfun = NoUpdtView
     elif isinstance(val, ClassViewObj):
-        val.UpdateClassViewInline()
-        val.UpdateClassView()
+        updtfun = ClassViewObjUpdtView
     elif isinstance(val, bool):
-        if isinstance(vw, gi.CheckBox):
-            svw = gi.CheckBox(vw)
-            svw.SetChecked(val)
-        else:
-            print("epygiv; bool value: %s doesn't have CheckBox widget" % nm)
+        updtfun = BoolUpdtView
     elif isinstance(val, (int, float)):
-        if isinstance(vw, gi.SpinBox):
-            svw = gi.SpinBox(vw)
-            svw.SetValue(val)
-        else:
-            print("epygiv; numerical value: %s doesn't have SpinBox widget" % nm)
+        updtfun = NumUpdtView
+    else:
+        updtfun = StrUpdtView
+    PyObjUpdtFuncs[typ] = updtfun
+    return updtfun
+
+def GoObjUpdtView(val, vv, nm):
+    """ updates the giv.ValueView for a Go object value """
+    giv.SetSoloValueIface(vv, val) # always update in case it might have changed
+    vv.UpdateWidget()
+
+def NoUpdtView(val, vw, nm):
+    pass
+
+def EnumUpdtView(val, vw, nm):
+    if isinstance(vw, gi.ComboBox):
+        svw = gi.ComboBox(vw)
+        svw.SetCurVal(val.name)
+    else:
+        print("epygiv; Enum value: %s doesn't have ComboBox widget" % nm)
+
+def ClassViewObjUpdtView(val, vw, nm):
+    val.UpdateClassViewInline()
+    val.UpdateClassView()
+
+def BoolUpdtView(val, vw, nm):
+    if isinstance(vw, gi.CheckBox):
+        svw = gi.CheckBox(vw)
+        svw.SetChecked(val)
+    else:
+        print("epygiv; bool value: %s doesn't have CheckBox widget" % nm)
+
+def NumUpdtView(val, vw, nm):
+    if isinstance(vw, gi.SpinBox):
+        svw = gi.SpinBox(vw)
+        svw.SetValue(val)
+    else:
+        print("epygiv; numerical value: %s doesn't have SpinBox widget" % nm)
+
+def StrUpdtView(val, vw, nm):
+    if isinstance(vw, gi.TextField):
+        tvw = gi.TextField(vw)
+        tvw.SetText(str(val))
     else:
-        if isinstance(vw, gi.TextField):
-            tvw = gi.TextField(vw)
-            tvw.SetText(str(val))
-        else:
-            print("epygiv; object %s = %s doesn't have expected TextField widget" % (nm, val))
+        print("epygiv; object %s = %s doesn't have expected TextField widget" % (nm, val))
     
+# PyObjUpdtFuncs maps exact value types to their updater, filled in as PyObjViewFuncs
+PyObjUpdtFuncs = {bool: BoolUpdtView, int: NumUpdtView, float: NumUpdtView, str: StrUpdtView}
+
+# the Set*View functions set the value on a widget made by the matching view
+# function, so unlike the Updt*View functions they skip checking and re-wrapping
+# the widget -- ClassView.Config pairs them with the widgets it makes, and Update
+# uses them while the field value keeps the type it had at Config
+
+def EnumSetView(val, vw, nm):
+    vw.SetCurVal(val.name)
+
+def BoolSetView(val, vw, nm):
+    vw.SetChecked(val)
+
+def NumSetView(val, vw, nm):
+    vw.SetValue(val)
+
+def StrSetView(val, vw, nm):
+    vw.SetText(str(val))
+
+# PyObjSetFuncs maps each view function to the setter for its widget
+PyObjSetFuncs = {EnumView: EnumSetView, ClassViewObjView: ClassViewObjUpdtView, BoolView: BoolSetView,
+                 NumView: NumSetView, StrView: StrSetView}
+
+# widget value accessors for the callbacks, resolved once at module load
+SpinBoxValue = operator.attrgetter("Value")
+TextFieldText = operator.methodcaller("Text")
+CheckBoxIsChecked = operator.methodcaller("IsChecked")
+
 def SetIntValCB(recv, send, sig, data):
     vw = gi.SpinBox(handle=send)
-    nm = vw.Name()
-    nms = nm.split(':')
-    cv = classviews[nms[0]]
-    setattr(cv.Class, nms[1], int(vw.Value))
+    cv, fld = fieldviews[vw.Name()]
+    setattr(cv.Class, fld, int(SpinBoxValue(vw)))
 
 def SetFloatValCB(recv, send, sig, data):
     vw = gi.SpinBox(handle=send)
-    nm = vw.Name()
-    nms = nm.split(':')
-    cv = classviews[nms[0]]
-    setattr(cv.Class, nms[1], float(vw.Value))
+    cv, fld = fieldviews[vw.Name()]
+    setattr(cv.Class, fld, float(SpinBoxValue(vw)))
 
 def EditObjCB(recv, send, sig, data):
     vw = gi.Action(handle=send)
     nm = vw.Name()
-    nms = nm.split(':')
-    cv = classviews[nms[0]]
-    fld = getattr(cv.Class, nms[1])
-    tags = cv.FieldTags(nms[1])
+    cv, fnm = fieldviews[nm]
+    fld = getattr(cv.Class, fnm)
+    tags = cv.FieldTags(fnm)
     nnm = nm.replace(":", "_")
     return fld.OpenViewDialog(vw.Viewport, nnm, tags)
 
@@ -368,43 +568,40 @@ def SetStrValCB(recv, send, sig, data):
     if sig != gi.TextFieldDone:
         return
     vw = gi.TextField(handle=send)
-    nm = vw.Name()
-    nms = nm.split(':')
-    cv = classviews[nms[0]]
-    setattr(cv.Class, nms[1], vw.Text())
+    cv, fld = fieldviews[vw.Name()]
+    setattr(cv.Class, fld, TextFieldText(vw))
 
 def SetBoolValCB(recv, send, sig, data):
     if sig != gi.ButtonToggled:
         return
     vw = gi.CheckBox(handle=send)
-    nm = vw.Name()
-    # print("cb name:", nm)
-    nms = nm.split(':')
-    cv = classviews[nms[0]]
-    setattr(cv.Class, nms[1], vw.IsChecked() != 0)
+    cv, fld = fieldviews[vw.Name()]
+    setattr(cv.Class, fld, CheckBoxIsChecked(vw) != 0)
 
 ##############
 # Enums
 
+# enumnames is a dictionary of go.Slice_string item names by Enum type, so
+# each combobox for the same Enum type shares one list
+enumnames = {}
+
+def EnumNames(typ):
+    """ returns go.Slice_string of item names for given Enum type, shared across calls """
+    sl = enumnames.get(typ)
+    if sl is None:
+        nnm = typ.__name__ + "N" # common convention of using the type name + N for last item in list
+        sl = go.Slice_string([en.name for en in typ if en.name != nnm])
+        enumnames[typ] = sl
+    return sl
+
 def ItemsFromEnum(cb, enm):
-    nms = []
-    typ = type(enm)
-    nnm = typ.__name__ + "N" # common convention of using the type name + N for last item in list
-    for en in typ:
-        if en.name != nnm:
-            nms.append(en.name)
-    cb.ItemsFromStringList(go.Slice_string(nms), False, 0)
+    cb.ItemsFromStringList(EnumNames(type(enm)), False, 0)
     cb.SetCurVal(enm.name)
     
 def SetEnumCB(recv, send, sig, data):
     vw = gi.ComboBox(handle=send)
-    nm = vw.Name()
-    nms = nm.split(':')
+    cv, fld = fieldviews[vw.Name()]
     idx = vw.CurIndex
-    cv = classviews[nms[0]]
-    flds = cv.Class.__dict__
-    typ = type(flds[nms[1]])
+    typ = type(cv.Class.__dict__[fld])
     vl = typ(idx)
-    setattr(cv.Class, nms[1], vl)
-    
-    
+    setattr(cv.Class, fld, vl)
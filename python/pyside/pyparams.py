@@ -3,34 +3,62 @@
 # license that can be found in the LICENSE file.
 
 from leabra import go, params
+import functools
+
+# parampaths caches the field path (names after the first .) for each param name
+parampaths = {}
+
+# paramconvs maps the type of the current field value to the function that
+# converts a param value string to that type -- other types are set as-is
+paramconvs = {int: int, float: float}
+
+# NotFound is returned by getattr for fields not in the class
+NotFound = object()
+
+def ParamPath(nm):
+    """ returns the list of field names for given param name, e.g., Sim.Field -> [Field] """
+    path = parampaths.get(nm)
+    if path is None:
+        path = nm.split('.')[1:]
+        parampaths[nm] = path
+    return path
+
+@functools.lru_cache(maxsize=4096)
+def ParamVal(conv, val):
+    """
+    returns param value string val converted with conv (int or float) --
+    cached, as sweeps apply the same values many times
+    """
+    return conv(val)
 
 def ApplyParams(cls, sheet, setMsg):
     """
     ApplyParams applies params.Sheet to cls
     """
-    flds = cls.__dict__
     for sl in sheet:
         sel = params.Sel(handle=sl)
         for nm, val in sel.Params:
-            flds = nm.split('.')[1:]
+            flds = ParamPath(nm)
+            last = len(flds) - 1
             tcls = cls
             for i, flnm in enumerate(flds):
                 # print("name: %s, value: %s\n" % (flnm, val))
-                if flnm in flds:
-                    cur = getattr(tcls, flnm)
+                cur = getattr(tcls, flnm, NotFound)
+                if cur is NotFound:
+                    print("ApplyParams error: field: %s not found in class\n" % flnm)
+                    break
+                conv = paramconvs.get(type(cur))
+                if conv is None:
                     if isinstance(cur, int):
-                        setattr(tcls, flnm, int(val))
+                        conv = int
                     elif isinstance(cur, float):
-                        setattr(tcls, flnm, float(val))
-                    else:
-                        if i == len(flds)-1:
-                            setattr(tcls, flnm, val)
-                        else:
-                            tcls = cur
-                            continue
-                    if setMsg:
-                        print("Field named: %s set to value: %s\n" % (flnm, val))
+                        conv = float
+                if conv is not None:
+                    setattr(tcls, flnm, ParamVal(conv, val))
+                elif i == last:
+                    setattr(tcls, flnm, val)
                 else:
-                    print("ApplyParams error: field: %s not found in class\n" % flnm)
-                
-
+                    tcls = cur
+                    continue
+                if setMsg:
+                    print("Field named: %s set to value: %s\n" % (flnm, val))